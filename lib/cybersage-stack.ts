@@ -7,7 +7,15 @@ import {
 } from "aws-cdk-lib";
 import { Construct } from "constructs";
 import { RetentionDays, LogGroup } from "aws-cdk-lib/aws-logs";
-import { Function, Runtime, Code, Architecture } from "aws-cdk-lib/aws-lambda";
+import {
+  Function,
+  Runtime,
+  Code,
+  Architecture,
+  ParamsAndSecretsLayerVersion,
+  ParamsAndSecretsVersions,
+  ParamsAndSecretsLogLevel,
+} from "aws-cdk-lib/aws-lambda";
 import { HttpApi, HttpMethod, CfnStage } from "aws-cdk-lib/aws-apigatewayv2";
 import { HttpLambdaIntegration } from "aws-cdk-lib/aws-apigatewayv2-integrations";
 import { Table, AttributeType, BillingMode } from "aws-cdk-lib/aws-dynamodb";
@@ -63,20 +71,28 @@ export class CyberSageCdkStack extends Stack {
 
     const lambdaZip = join(__dirname, "../lambda/s-cybersage-rs/bootstrap.zip");
     const discordBotHandler = new Function(this, "DiscordBotHandler", {
-      runtime: Runtime.PROVIDED_AL2,
+      runtime: Runtime.PROVIDED_AL2023,
       architecture: Architecture.ARM_64,
       handler: "bootstrap",
       code: Code.fromAsset(lambdaZip),
-      memorySize: 256,
+      memorySize: 1769,
       timeout: Duration.seconds(10),
       environment: {
         ROLE_MAPPINGS_TABLE_NAME: roleMappingsTable.tableName,
         GUILD_SUBSCRIPTIONS_TABLE_NAME: guildSubscriptionsTable.tableName,
         DISCORD_TOKEN_SECRET_ARN: discordTokenSecret.secretArn,
         DISCORD_PUBLIC_KEY_SECRET_ARN: discordPublicKeySecret.secretArn,
-        RUST_LOG: "info",
+        RUST_LOG: "warn",
       },
       logGroup: botLogGroup,
+      paramsAndSecrets: ParamsAndSecretsLayerVersion.fromVersion(
+        ParamsAndSecretsVersions.V1_0_103,
+        {
+          cacheSize: 10,
+          secretsManagerTtl: Duration.minutes(5),
+          logLevel: ParamsAndSecretsLogLevel.WARN,
+        },
+      ),
     });
 
     roleMappingsTable.grantReadWriteData(discordBotHandler);
@@ -99,9 +115,30 @@ export class CyberSageCdkStack extends Stack {
       },
     });
 
+    const provisionedConcurrencyContext = this.node.tryGetContext(
+      "provisionedConcurrency",
+    );
+
+    let provisionedConcurrency: number | undefined;
+    if (provisionedConcurrencyContext !== undefined) {
+      provisionedConcurrency = Number(provisionedConcurrencyContext);
+      if (
+        !Number.isInteger(provisionedConcurrency) ||
+        provisionedConcurrency < 1
+      ) {
+        throw new Error(
+          `provisionedConcurrency must be a positive integer, got "${provisionedConcurrencyContext}"`,
+        );
+      }
+    }
+
+    const discordBotAlias = discordBotHandler.addAlias("live", {
+      provisionedConcurrentExecutions: provisionedConcurrency,
+    });
+
     const lambdaIntegration = new HttpLambdaIntegration(
       "DiscordBotIntegration",
-      discordBotHandler,
+      discordBotAlias,
     );
 
     api.addRoutes({
@@ -20,12 +20,23 @@ impl AuthManager {
         }
     }
 
+    pub fn parse_public_key(public_key_hex: &str) -> Result<VerifyingKey> {
+        let public_key_bytes =
+            hex::decode(public_key_hex).context("Failed to decode public key hex")?;
+
+        let public_key_array: &[u8; 32] = public_key_bytes
+            .as_slice()
+            .try_into()
+            .context("Public key has invalid length")?;
+
+        VerifyingKey::from_bytes(public_key_array).context("Invalid public key bytes")
+    }
+
     pub fn verify_signature(
-        &self,
         signature_hex: &str,
         timestamp: &str,
         body: &[u8],
-        public_key_hex: &str,
+        public_key: &VerifyingKey,
     ) -> Result<()> {
         if signature_hex.is_empty() || timestamp.is_empty() {
             bail!("Missing required Discord signature headers");
@@ -45,26 +56,11 @@ impl AuthManager {
             bail!("Request timestamp is too old");
         }
 
-        let public_key_bytes =
-            hex::decode(public_key_hex).context("Failed to decode public key hex")?;
-
-        let public_key_array: &[u8; 32] = public_key_bytes
-            .as_slice()
-            .try_into()
-            .context("Public key has invalid length")?;
-
-        let signature_bytes =
-            hex::decode(signature_hex).context("Failed to decode signature hex")?;
-
-        let signature_array: &[u8; 64] = signature_bytes
-            .as_slice()
-            .try_into()
-            .context("Signature has invalid length")?;
-
-        let public_key =
-            VerifyingKey::from_bytes(public_key_array).context("Invalid public key bytes")?;
+        let mut signature_bytes = [0u8; Signature::BYTE_SIZE];
+        hex::decode_to_slice(signature_hex, &mut signature_bytes)
+            .context("Failed to decode signature hex")?;
 
-        let signature = Signature::from_bytes(signature_array);
+        let signature = Signature::from_bytes(&signature_bytes);
 
         let mut message = Vec::with_capacity(timestamp.len() + body.len());
         message.extend_from_slice(timestamp.as_bytes());
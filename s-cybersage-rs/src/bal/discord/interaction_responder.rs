@@ -0,0 +1,69 @@
+use anyhow::{Context, Result};
+use reqwest::Client;
+use serde_json::json;
+use std::time::Duration;
+
+use crate::dal::model::{
+    interaction_request::InteractionRequest, interaction_response::InteractionResponse,
+};
+
+const CALLBACK_TIMEOUT: Duration = Duration::from_secs(1);
+const EDIT_TIMEOUT: Duration = Duration::from_secs(2);
+
+pub struct InteractionResponder {
+    client: Client,
+}
+
+impl InteractionResponder {
+    pub fn new(client: Client) -> Self {
+        Self { client }
+    }
+
+    pub async fn send_callback(
+        &self,
+        interaction: &InteractionRequest,
+        response: &InteractionResponse,
+    ) -> Result<()> {
+        let url = format!(
+            "https://discord.com/api/v10/interactions/{}/{}/callback",
+            interaction.id, interaction.token
+        );
+
+        self.client
+            .post(&url)
+            .timeout(CALLBACK_TIMEOUT)
+            .json(response)
+            .send()
+            .await
+            .context("Failed to send interaction callback")?
+            .error_for_status()
+            .context("Discord returned error for interaction callback")?;
+
+        Ok(())
+    }
+
+    pub async fn edit_original(
+        &self,
+        interaction: &InteractionRequest,
+        response: &InteractionResponse,
+    ) -> Result<()> {
+        let url = format!(
+            "https://discord.com/api/v10/webhooks/{}/{}/messages/@original",
+            interaction.application_id, interaction.token
+        );
+
+        let content = response.data.as_ref().and_then(|d| d.content.as_deref());
+
+        self.client
+            .patch(&url)
+            .timeout(EDIT_TIMEOUT)
+            .json(&json!({ "content": content }))
+            .send()
+            .await
+            .context("Failed to edit original interaction response")?
+            .error_for_status()
+            .context("Discord returned error while editing original response")?;
+
+        Ok(())
+    }
+}
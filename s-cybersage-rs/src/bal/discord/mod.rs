@@ -1 +1,2 @@
+pub mod interaction_responder;
 pub mod role_manager;
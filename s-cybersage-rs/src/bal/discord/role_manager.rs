@@ -1,6 +1,5 @@
 use anyhow::{bail, Context, Result};
-use reqwest::{Client, StatusCode};
-use serde::Deserialize;
+use reqwest::{header::HeaderValue, Client, StatusCode};
 use tracing::{error, info, warn};
 
 #[derive(Debug, Clone, Copy)]
@@ -9,56 +8,21 @@ pub enum RoleAction {
     Remove,
 }
 
-#[derive(Debug, Deserialize)]
-struct GuildMember {
-    roles: Vec<String>,
-}
-
 pub struct RoleManager {
     client: Client,
-    bot_token: String,
+    authorization: HeaderValue,
 }
 
 impl RoleManager {
-    pub fn new(client: Client, bot_token: impl Into<String>) -> Self {
-        Self {
-            client,
-            bot_token: bot_token.into(),
-        }
-    }
-
-    pub async fn fetch_member_roles(&self, guild_id: &str, user_id: &str) -> Result<Vec<String>> {
-        let url = format!(
-            "https://discord.com/api/v10/guilds/{}/members/{}",
-            guild_id, user_id
-        );
-
-        let resp = self
-            .client
-            .get(&url)
-            .header("Authorization", format!("Bot {}", self.bot_token))
-            .send()
-            .await
-            .context("Failed to send fetch_member_roles request")?;
-
-        if resp.status() == StatusCode::NOT_FOUND {
-            bail!("Member not found in guild");
-        }
+    pub fn new(client: Client, bot_token: impl AsRef<str>) -> Result<Self> {
+        let mut authorization = HeaderValue::from_str(&format!("Bot {}", bot_token.as_ref()))
+            .context("Bot token is not a valid header value")?;
+        authorization.set_sensitive(true);
 
-        if resp.status() == StatusCode::FORBIDDEN {
-            bail!("Bot lacks permission to fetch member");
-        }
-
-        let resp = resp
-            .error_for_status()
-            .context("Discord returned error while fetching member")?;
-
-        let member: GuildMember = resp
-            .json()
-            .await
-            .context("Failed to deserialize GuildMember")?;
-
-        Ok(member.roles)
+        Ok(Self {
+            client,
+            authorization,
+        })
     }
 
     pub async fn modify_user_role(
@@ -79,50 +43,42 @@ impl RoleManager {
         };
 
         let resp = request_builder
-            .header("Authorization", format!("Bot {}", self.bot_token))
+            .header("Authorization", self.authorization.clone())
             .send()
             .await
             .context("Failed to send modify_user_role request")?;
 
         match resp.status() {
             status if status.is_success() => {
-                info!(
-                    "Successfully {:?} role {} for user {}",
-                    action, role_id, user_id
-                );
+                info!(?action, role_id, user_id, "Modified role");
                 Ok(())
             }
 
             StatusCode::FORBIDDEN => {
-                error!(
-                    "Permission error while {:?} role {} for user {}",
-                    action, role_id, user_id
-                );
+                error!(?action, role_id, user_id, "Missing permission for role");
                 bail!("Bot lacks permission to modify role (check role hierarchy)")
             }
 
             StatusCode::NOT_FOUND => {
-                error!(
-                    "Role or user not found while {:?} role {} for user {}",
-                    action, role_id, user_id
-                );
+                error!(?action, role_id, user_id, "Role or user not found");
                 bail!("Role or user not found")
             }
 
             StatusCode::TOO_MANY_REQUESTS => {
                 let body = resp.text().await.unwrap_or_default();
-                warn!(
-                    "Rate limited while {:?} role {} for user {}: {}",
-                    action, role_id, user_id, body
-                );
+                warn!(?action, role_id, user_id, %body, "Rate limited while modifying role");
                 bail!("Rate limited by Discord API")
             }
 
             other => {
                 let body = resp.text().await.unwrap_or_default();
                 error!(
-                    "Failed to {:?} role {} for user {}: status {}, body: {}",
-                    action, role_id, user_id, other, body
+                    ?action,
+                    role_id,
+                    user_id,
+                    status = %other,
+                    %body,
+                    "Failed to modify role"
                 );
                 bail!("Discord API error: {}", other);
             }
@@ -138,18 +138,14 @@ impl CommandRouter {
                     None => return Ok(InteractionResponse::ephemeral("Role not self-assignable.")),
                 };
 
-                let user_id = interaction
-                    .member
-                    .as_ref()
-                    .map(|m| m.user.id.as_str())
-                    .unwrap_or("");
+                let member = match interaction.member.as_ref() {
+                    Some(m) => m,
+                    None => return Ok(InteractionResponse::ephemeral("Member data missing.")),
+                };
 
-                let member_roles = self
-                    .role_manager
-                    .fetch_member_roles(guild_id, user_id)
-                    .await?;
+                let user_id = member.user.id.as_str();
 
-                let has_role = member_roles.iter().any(|r| r == &role_id);
+                let has_role = member.roles.iter().any(|r| r == &role_id);
 
                 let action = if has_role {
                     RoleAction::Remove
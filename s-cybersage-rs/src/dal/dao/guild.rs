@@ -1,5 +1,19 @@
 use anyhow::{Context, Result};
 use aws_sdk_dynamodb::{types::AttributeValue, Client};
+use once_cell::sync::Lazy;
+use std::{
+    collections::HashMap,
+    sync::Mutex,
+    time::{Duration, Instant},
+};
+
+const ROLE_CACHE_TTL: Duration = Duration::from_secs(300);
+const ROLE_KEY_PREFIX: &str = "ROLE#";
+
+type GuildRoles = HashMap<String, (String, String)>;
+
+static ROLE_CACHE: Lazy<Mutex<HashMap<String, (Instant, GuildRoles)>>> =
+    Lazy::new(|| Mutex::new(HashMap::new()));
 
 pub struct GuildDao {
     client: Client,
@@ -104,11 +118,24 @@ impl GuildDao {
             )
             .item("role_id", AttributeValue::S(role_id.to_string()))
             .item("role_name", AttributeValue::S(role_name.to_string()))
-            .item("role_name_normalized", AttributeValue::S(normalized_name))
+            .item(
+                "role_name_normalized",
+                AttributeValue::S(normalized_name.clone()),
+            )
             .send()
             .await
             .context("Failed to save role")?;
 
+        if let Ok(mut cache) = ROLE_CACHE.lock() {
+            if let Some((_, roles)) = cache.get_mut(guild_id) {
+                roles.retain(|_, (_, id)| id != role_id);
+                roles.insert(
+                    normalized_name,
+                    (role_name.to_string(), role_id.to_string()),
+                );
+            }
+        }
+
         Ok(())
     }
 
@@ -119,37 +146,66 @@ impl GuildDao {
     ) -> Result<Option<(String, String)>> {
         let normalized_name = role_name.to_lowercase();
 
-        let response = self
-            .client
-            .query()
-            .table_name(&self.table_name)
-            .index_name("GuildRoleNameIndex")
-            .key_condition_expression("guild_id = :guild_id AND role_name_normalized = :role_name")
-            .expression_attribute_values(":guild_id", AttributeValue::S(guild_id.to_string()))
-            .expression_attribute_values(":role_name", AttributeValue::S(normalized_name))
-            .limit(1)
-            .send()
-            .await
-            .context("Failed to query role by name")?;
+        if let Some(role) = cached_role(guild_id, &normalized_name) {
+            return Ok(role);
+        }
+
+        let roles = self.load_guild_roles(guild_id).await?;
+        let role = roles.get(&normalized_name).cloned();
 
-        if let Some(mut items) = response.items {
-            if let Some(item) = items.pop() {
-                let role_name = item
-                    .get("role_name")
-                    .and_then(|v| v.as_s().ok())
-                    .map(|s| s.to_string());
+        if let Ok(mut cache) = ROLE_CACHE.lock() {
+            cache.insert(guild_id.to_string(), (Instant::now(), roles));
+        }
+
+        Ok(role)
+    }
 
-                let role_id = item
-                    .get("role_id")
-                    .and_then(|v| v.as_s().ok())
-                    .map(|s| s.to_string());
+    async fn load_guild_roles(&self, guild_id: &str) -> Result<GuildRoles> {
+        let mut roles = GuildRoles::new();
+        let mut exclusive_start_key = None;
+
+        loop {
+            let response = self
+                .client
+                .query()
+                .table_name(&self.table_name)
+                .key_condition_expression(
+                    "guild_id = :guild_id AND begins_with(mapping_key, :prefix)",
+                )
+                .expression_attribute_values(":guild_id", AttributeValue::S(guild_id.to_string()))
+                .expression_attribute_values(
+                    ":prefix",
+                    AttributeValue::S(ROLE_KEY_PREFIX.to_string()),
+                )
+                .set_exclusive_start_key(exclusive_start_key)
+                .send()
+                .await
+                .context("Failed to load guild roles")?;
+
+            for item in response.items.unwrap_or_default() {
+                let role_name = item.get("role_name").and_then(|v| v.as_s().ok());
+                let role_id = item.get("role_id").and_then(|v| v.as_s().ok());
 
                 if let (Some(name), Some(id)) = (role_name, role_id) {
-                    return Ok(Some((name, id)));
+                    roles.insert(name.to_lowercase(), (name.to_string(), id.to_string()));
                 }
             }
+
+            match response.last_evaluated_key {
+                Some(key) if !key.is_empty() => exclusive_start_key = Some(key),
+                _ => break,
+            }
         }
 
-        Ok(None)
+        Ok(roles)
     }
 }
+
+fn cached_role(guild_id: &str, normalized_name: &str) -> Option<Option<(String, String)>> {
+    let cache = ROLE_CACHE.lock().ok()?;
+
+    cache
+        .get(guild_id)
+        .filter(|(cached_at, _)| cached_at.elapsed() < ROLE_CACHE_TTL)
+        .map(|(_, roles)| roles.get(normalized_name).cloned())
+}
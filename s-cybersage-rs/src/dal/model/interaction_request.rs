@@ -19,6 +19,9 @@ pub struct InteractionRequest {
     #[serde(rename = "application_id")]
     pub application_id: String,
 
+    #[serde(default)]
+    pub token: String,
+
     #[serde(rename = "type")]
     pub interaction_type: InteractionType,
 
@@ -1,5 +1,6 @@
 use serde::Serialize;
 use serde_repr::Serialize_repr;
+use std::borrow::Cow;
 
 bitflags::bitflags! {
     pub struct MessageFlags: u64 {
@@ -12,6 +13,7 @@ bitflags::bitflags! {
 pub enum InteractionCallbackType {
     Pong = 1,
     ChannelMessageWithSource = 4,
+    DeferredChannelMessageWithSource = 5,
     ApplicationCommandAutocompleteResult = 8,
 }
 
@@ -27,7 +29,7 @@ pub struct InteractionResponse {
 #[derive(Debug, Serialize)]
 pub struct InteractionCallbackData {
     #[serde(skip_serializing_if = "Option::is_none")]
-    pub content: Option<String>,
+    pub content: Option<Cow<'static, str>>,
 
     #[serde(skip_serializing_if = "Option::is_none")]
     pub flags: Option<u64>,
@@ -50,7 +52,7 @@ impl InteractionResponse {
         }
     }
 
-    pub fn message(content: impl Into<String>) -> Self {
+    pub fn message(content: impl Into<Cow<'static, str>>) -> Self {
         Self {
             kind: InteractionCallbackType::ChannelMessageWithSource,
             data: Some(InteractionCallbackData {
@@ -61,7 +63,7 @@ impl InteractionResponse {
         }
     }
 
-    pub fn ephemeral(content: impl Into<String>) -> Self {
+    pub fn ephemeral(content: impl Into<Cow<'static, str>>) -> Self {
         Self {
             kind: InteractionCallbackType::ChannelMessageWithSource,
             data: Some(InteractionCallbackData {
@@ -72,6 +74,17 @@ impl InteractionResponse {
         }
     }
 
+    pub fn deferred_ephemeral() -> Self {
+        Self {
+            kind: InteractionCallbackType::DeferredChannelMessageWithSource,
+            data: Some(InteractionCallbackData {
+                content: None,
+                flags: Some(MessageFlags::EPHEMERAL.bits()),
+                choices: None,
+            }),
+        }
+    }
+
     pub fn autocomplete(choices: Vec<ApplicationCommandOptionChoice>) -> Self {
         Self {
             kind: InteractionCallbackType::ApplicationCommandAutocompleteResult,
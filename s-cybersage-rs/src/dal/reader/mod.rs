@@ -1 +1,2 @@
-pub mod secrets_reader;
\ No newline at end of file
+pub mod secrets_manager_reader;
+pub mod secrets_reader;
@@ -0,0 +1,45 @@
+use anyhow::{Context, Result};
+use aws_sdk_secretsmanager::Client;
+use tokio::sync::OnceCell;
+
+use super::secrets_reader::parse_secret_string;
+
+#[derive(Clone)]
+pub struct SecretsManagerReader {
+    client: Client,
+}
+
+impl SecretsManagerReader {
+    pub fn new(client: Client) -> Self {
+        Self { client }
+    }
+
+    async fn fetch_secret_string(&self, secret_id: &str, key: &str) -> Result<String> {
+        let response = self
+            .client
+            .get_secret_value()
+            .secret_id(secret_id)
+            .send()
+            .await
+            .context("Failed to retrieve secret value from Secrets Manager")?;
+
+        let secret_str = response
+            .secret_string()
+            .context("Secret value is missing or not a string")?;
+
+        parse_secret_string(secret_str, key)
+    }
+
+    pub async fn get_secret_value(
+        &self,
+        secret_id: &str,
+        key: &str,
+        cache: &OnceCell<String>,
+    ) -> Result<String> {
+        let secret = cache
+            .get_or_try_init(|| async { self.fetch_secret_string(secret_id, key).await })
+            .await?;
+
+        Ok(secret.clone())
+    }
+}
@@ -1,8 +1,17 @@
 use anyhow::{Context, Result};
-use aws_sdk_secretsmanager::Client;
+use reqwest::Client;
+use serde::Deserialize;
 use serde_json::Value;
 use tokio::sync::OnceCell;
 
+const DEFAULT_EXTENSION_PORT: &str = "2773";
+
+#[derive(Debug, Deserialize)]
+struct SecretValueResponse {
+    #[serde(rename = "SecretString")]
+    secret_string: Option<String>,
+}
+
 #[derive(Clone)]
 pub struct SecretsReader {
     client: Client,
@@ -13,35 +22,92 @@ impl SecretsReader {
         Self { client }
     }
 
-    async fn fetch_secret_json(&self, secret_id: &str) -> Result<Value> {
-        let response = self
+    async fn fetch_secret_string(&self, secret_id: &str, key: &str) -> Result<String> {
+        let port = std::env::var("PARAMETERS_SECRETS_EXTENSION_HTTP_PORT")
+            .unwrap_or_else(|_| DEFAULT_EXTENSION_PORT.to_string());
+
+        let session_token =
+            std::env::var("AWS_SESSION_TOKEN").context("AWS_SESSION_TOKEN is not set")?;
+
+        let response: SecretValueResponse = self
             .client
-            .get_secret_value()
-            .secret_id(secret_id)
+            .get(format!("http://localhost:{}/secretsmanager/get", port))
+            .query(&[("secretId", secret_id)])
+            .header("X-Aws-Parameters-Secrets-Token", session_token)
             .send()
             .await
-            .context("Failed to retrieve secret value from Secrets Manager")?;
+            .context("Failed to retrieve secret value from secrets extension")?
+            .error_for_status()
+            .context("Secrets extension returned an error")?
+            .json()
+            .await
+            .context("Failed to deserialize secrets extension response")?;
 
         let secret_str = response
-            .secret_string()
+            .secret_string
             .context("Secret value is missing or not a string")?;
 
-        serde_json::from_str(secret_str).context("Failed to parse secret string as JSON")
+        parse_secret_string(&secret_str, key)
     }
 
     pub async fn get_secret_value(
         &self,
         secret_id: &str,
         key: &str,
-        cache: &OnceCell<Value>,
+        cache: &OnceCell<String>,
     ) -> Result<String> {
-        let json = cache
-            .get_or_try_init(|| async { self.fetch_secret_json(secret_id).await })
+        let secret = cache
+            .get_or_try_init(|| async { self.fetch_secret_string(secret_id, key).await })
             .await?;
 
-        json.get(key)
-            .and_then(|v| v.as_str())
-            .map(|s| s.to_string())
-            .context(format!("Key '{}' not found in secret JSON", key))
+        Ok(secret.clone())
+    }
+}
+
+pub(crate) fn parse_secret_string(secret_str: &str, key: &str) -> Result<String> {
+    let secret_str = secret_str.trim();
+
+    if !secret_str.starts_with('{') {
+        return Ok(secret_str.to_string());
+    }
+
+    let legacy: Value =
+        serde_json::from_str(secret_str).context("Failed to parse legacy JSON secret")?;
+
+    legacy
+        .get(key)
+        .and_then(|v| v.as_str())
+        .map(|s| s.trim().to_string())
+        .context(format!("Key '{}' not found in secret JSON", key))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::parse_secret_string;
+
+    #[test]
+    fn plain_secret_is_trimmed() {
+        assert_eq!(parse_secret_string("abc123\n", "token").unwrap(), "abc123");
+    }
+
+    #[test]
+    fn legacy_json_secret_reads_named_key() {
+        assert_eq!(
+            parse_secret_string(r#"{"token":"abc123"}"#, "token").unwrap(),
+            "abc123"
+        );
+    }
+
+    #[test]
+    fn legacy_json_secret_ignores_extra_keys() {
+        assert_eq!(
+            parse_secret_string(r#"{"token":"abc123","note":"rotated"}"#, "token").unwrap(),
+            "abc123"
+        );
+    }
+
+    #[test]
+    fn legacy_json_secret_rejects_wrong_key() {
+        assert!(parse_secret_string(r#"{"key":"abc123"}"#, "token").is_err());
     }
 }
@@ -1,33 +1,51 @@
+use anyhow::Context;
 use aws_sdk_dynamodb::{Client as DynamoClient};
 use aws_sdk_secretsmanager::Client as SecretsClient;
+use ed25519_dalek::VerifyingKey;
 use lambda_http::{Body, Error, Request, Response};
-use serde_json::json;
-use tokio::sync::OnceCell;
+use std::{future::Future, time::Duration};
+use tokio::{sync::OnceCell, time::Instant};
+use tracing::error;
 
 use crate::{
     bal::{
         auth::verify::AuthManager,
-        discord::role_manager::RoleManager,
+        discord::{interaction_responder::InteractionResponder, role_manager::RoleManager},
         route::{command_router::CommandRouter, interaction_router::InteractionRouter},
     },
     dal::{
         dao::{guild::GuildDao, subscription::SubscriptionReader},
-        model::interaction_request::InteractionRequest,
-        reader::secrets_reader::SecretsReader,
+        model::{
+            interaction_request::{InteractionRequest, InteractionType},
+            interaction_response::InteractionResponse,
+        },
+        reader::{secrets_manager_reader::SecretsManagerReader, secrets_reader::SecretsReader},
     },
 };
 
-static DISCORD_PUBLIC_KEY_CACHE: OnceCell<serde_json::Value> = OnceCell::const_new();
-static DISCORD_TOKEN_CACHE: OnceCell<serde_json::Value> = OnceCell::const_new();
+const RESPONSE_DEADLINE: Duration = Duration::from_secs(2);
+const FOLLOW_UP_DEADLINE: Duration = Duration::from_secs(7);
+
+const SERVER_ERROR_BODY: &str = r#"{"error":"Server misconfiguration"}"#;
+const INVALID_SIGNATURE_BODY: &str = r#"{"error":"Invalid request signature"}"#;
+const INVALID_JSON_BODY: &str = r#"{"error":"Invalid JSON"}"#;
+
+const PONG_BODY: &str = r#"{"type":1}"#;
+const GUILD_ID_MISSING_BODY: &str =
+    r#"{"type":4,"data":{"content":"Guild ID missing.","flags":64}}"#;
+
+static DISCORD_PUBLIC_KEY_CACHE: OnceCell<String> = OnceCell::const_new();
+static DISCORD_VERIFYING_KEY: OnceCell<VerifyingKey> = OnceCell::const_new();
+static DISCORD_TOKEN_CACHE: OnceCell<String> = OnceCell::const_new();
 
 pub(crate) async fn function_handler(
     event: Request,
     dynamo_client: DynamoClient,
-    secrets_client: SecretsClient,
     http_client: reqwest::Client,
 ) -> Result<Response<Body>, Error> {
+    let started = Instant::now();
+
     let body_bytes = event.body().as_ref();
-    let body_str = std::str::from_utf8(body_bytes).unwrap_or("");
 
     let headers = event.headers();
 
@@ -41,94 +59,188 @@ pub(crate) async fn function_handler(
         .and_then(|v| v.to_str().ok())
         .unwrap_or("");
 
-    let secrets_reader = SecretsReader::new(secrets_client.clone());
-
-    let public_key_secret_arn = match std::env::var("DISCORD_PUBLIC_KEY_SECRET_ARN") {
-        Ok(v) => v,
-        Err(_) => return Ok(server_error()),
-    };
-
-    let discord_public_key = match secrets_reader
-        .get_secret_value(&public_key_secret_arn, "key", &DISCORD_PUBLIC_KEY_CACHE)
-        .await
-    {
-        Ok(v) => v,
-        Err(_) => return Ok(server_error()),
-    };
-
-    let subscription_table = match std::env::var("GUILD_SUBSCRIPTIONS_TABLE_NAME") {
+    let discord_public_key = match verifying_key(&SecretsReader::new(http_client.clone())).await {
         Ok(v) => v,
         Err(_) => return Ok(server_error()),
     };
 
-    let subscription_reader = SubscriptionReader::new(dynamo_client.clone(), subscription_table);
-
-    let auth_manager = AuthManager::new(subscription_reader.clone());
-
-    if auth_manager
-        .verify_signature(signature, timestamp, body_bytes, &discord_public_key)
-        .is_err()
+    if AuthManager::verify_signature(signature, timestamp, body_bytes, discord_public_key).is_err()
     {
-        return Ok(json_response(
-            401,
-            &json!({ "error": "Invalid request signature" }),
-        ));
+        return Ok(static_json_response(401, INVALID_SIGNATURE_BODY));
     }
 
-    let interaction: InteractionRequest = match serde_json::from_str(body_str) {
+    let interaction: InteractionRequest = match serde_json::from_slice(body_bytes) {
         Ok(i) => i,
-        Err(_) => return Ok(json_response(400, &json!({ "error": "Invalid JSON" }))),
+        Err(_) => return Ok(static_json_response(400, INVALID_JSON_BODY)),
     };
 
+    if let InteractionType::Ping = interaction.interaction_type {
+        return Ok(static_json_response(200, PONG_BODY));
+    }
+
     let guild_id = match interaction.guild_id.as_deref() {
         Some(id) => id,
-        None => return Ok(ephemeral_response("Guild ID missing.")),
+        None => return Ok(static_json_response(200, GUILD_ID_MISSING_BODY)),
     };
 
-    if let Err(_) = auth_manager.verify_subscription(guild_id).await {
-        return Ok(ephemeral_response(
+    let work = process_interaction(&interaction, guild_id, dynamo_client, http_client.clone());
+
+    if let InteractionType::ApplicationCommand = interaction.interaction_type {
+        let responder = InteractionResponder::new(http_client);
+        return Ok(respond_before_deadline(&responder, &interaction, started, work).await);
+    }
+
+    Ok(inline_response(work.await))
+}
+
+async fn process_interaction(
+    interaction: &InteractionRequest,
+    guild_id: &str,
+    dynamo_client: DynamoClient,
+    http_client: reqwest::Client,
+) -> anyhow::Result<InteractionResponse> {
+    let subscription_table = std::env::var("GUILD_SUBSCRIPTIONS_TABLE_NAME")
+        .context("GUILD_SUBSCRIPTIONS_TABLE_NAME is not set")?;
+
+    let role_table =
+        std::env::var("ROLE_MAPPINGS_TABLE_NAME").context("ROLE_MAPPINGS_TABLE_NAME is not set")?;
+
+    let token_secret_arn =
+        std::env::var("DISCORD_TOKEN_SECRET_ARN").context("DISCORD_TOKEN_SECRET_ARN is not set")?;
+
+    let subscription_reader = SubscriptionReader::new(dynamo_client.clone(), subscription_table);
+
+    let auth_manager = AuthManager::new(subscription_reader);
+
+    let secrets_reader = SecretsReader::new(http_client.clone());
+
+    let (subscription, discord_token) = tokio::join!(
+        auth_manager.verify_subscription(guild_id),
+        secrets_reader.get_secret_value(&token_secret_arn, "token", &DISCORD_TOKEN_CACHE),
+    );
+
+    if subscription.is_err() {
+        return Ok(InteractionResponse::ephemeral(
             "This guild does not have an active subscription.",
         ));
     }
 
-    let role_table = match std::env::var("ROLE_MAPPINGS_TABLE_NAME") {
-        Ok(v) => v,
-        Err(_) => return Ok(server_error()),
-    };
+    let role_manager = RoleManager::new(http_client, discord_token?)?;
 
-    let guild_dao = GuildDao::new(dynamo_client.clone(), role_table);
+    let guild_dao = GuildDao::new(dynamo_client, role_table);
 
-    let token_secret_arn = match std::env::var("DISCORD_TOKEN_SECRET_ARN") {
-        Ok(v) => v,
-        Err(_) => return Ok(server_error()),
-    };
+    let command_router = CommandRouter::new(guild_dao, role_manager);
 
-    let discord_token = match secrets_reader
-        .get_secret_value(&token_secret_arn, "token", &DISCORD_TOKEN_CACHE)
+    let interaction_router = InteractionRouter::new(command_router);
+
+    Ok(interaction_router
+        .route(interaction)
         .await
-    {
-        Ok(v) => v,
-        Err(_) => return Ok(server_error()),
-    };
+        .unwrap_or_else(|e| {
+            error!(error = ?e, "Failed to route interaction");
+            InteractionResponse::ephemeral("Internal error.")
+        }))
+}
 
-    let role_manager = RoleManager::new(http_client.clone(), discord_token);
+async fn respond_before_deadline(
+    responder: &InteractionResponder,
+    interaction: &InteractionRequest,
+    started: Instant,
+    work: impl Future<Output = anyhow::Result<InteractionResponse>>,
+) -> Response<Body> {
+    tokio::pin!(work);
 
-    let command_router = CommandRouter::new(guild_dao, role_manager);
+    tokio::select! {
+        result = &mut work => return inline_response(result),
+        _ = tokio::time::sleep_until(started + RESPONSE_DEADLINE) => {}
+    }
 
-    let interaction_router = InteractionRouter::new(command_router);
+    let (acknowledged, outcome) = tokio::join!(
+        responder.send_callback(interaction, &InteractionResponse::deferred_ephemeral()),
+        tokio::time::timeout_at(started + FOLLOW_UP_DEADLINE, work),
+    );
+
+    if let Err(e) = &acknowledged {
+        error!(error = ?e, "Failed to defer interaction response");
+    }
 
-    let response = match interaction_router.route(&interaction).await {
-        Ok(r) => r,
-        Err(_) => crate::dal::model::interaction_response::InteractionResponse::ephemeral(
-            "Internal error.",
-        ),
+    let response = match outcome {
+        Ok(Ok(r)) => r,
+        Ok(Err(e)) => {
+            error!(error = ?e, "Deferred interaction failed");
+            InteractionResponse::ephemeral("Internal error.")
+        }
+        Err(_) => {
+            error!(deadline = ?FOLLOW_UP_DEADLINE, "Deferred interaction timed out");
+            InteractionResponse::ephemeral("Request timed out.")
+        }
     };
 
-    Ok(json_response(200, &response))
+    if acknowledged.is_err() {
+        return json_response(200, &response);
+    }
+
+    if let Err(e) = responder.edit_original(interaction, &response).await {
+        error!(error = ?e, "Failed to edit deferred interaction response");
+    }
+
+    accepted()
+}
+
+fn inline_response(result: anyhow::Result<InteractionResponse>) -> Response<Body> {
+    match result {
+        Ok(r) => json_response(200, &r),
+        Err(e) => {
+            error!(error = ?e, "Failed to process interaction");
+            server_error()
+        }
+    }
+}
+
+pub(crate) async fn init_verifying_key(
+    secrets_client: SecretsClient,
+    http_client: reqwest::Client,
+) -> anyhow::Result<()> {
+    let public_key_secret_arn = std::env::var("DISCORD_PUBLIC_KEY_SECRET_ARN")?;
+
+    SecretsManagerReader::new(secrets_client)
+        .get_secret_value(&public_key_secret_arn, "key", &DISCORD_PUBLIC_KEY_CACHE)
+        .await?;
+
+    verifying_key(&SecretsReader::new(http_client)).await?;
+    Ok(())
+}
+
+pub(crate) async fn init_bot_token(secrets_client: SecretsClient) -> anyhow::Result<()> {
+    let token_secret_arn = std::env::var("DISCORD_TOKEN_SECRET_ARN")?;
+
+    SecretsManagerReader::new(secrets_client)
+        .get_secret_value(&token_secret_arn, "token", &DISCORD_TOKEN_CACHE)
+        .await?;
+
+    Ok(())
+}
+
+async fn verifying_key(secrets_reader: &SecretsReader) -> anyhow::Result<&'static VerifyingKey> {
+    DISCORD_VERIFYING_KEY
+        .get_or_try_init(|| async {
+            let public_key_secret_arn = std::env::var("DISCORD_PUBLIC_KEY_SECRET_ARN")?;
+
+            let public_key_hex = secrets_reader
+                .get_secret_value(&public_key_secret_arn, "key", &DISCORD_PUBLIC_KEY_CACHE)
+                .await?;
+
+            AuthManager::parse_public_key(&public_key_hex)
+        })
+        .await
 }
 
 fn server_error() -> Response<Body> {
-    json_response(500, &json!({ "error": "Server misconfiguration" }))
+    static_json_response(500, SERVER_ERROR_BODY)
+}
+
+fn accepted() -> Response<Body> {
+    Response::builder().status(202).body(Body::Empty).unwrap()
 }
 
 fn json_response<T: serde::Serialize>(status: u16, body: &T) -> Response<Body> {
@@ -141,9 +253,44 @@ fn json_response<T: serde::Serialize>(status: u16, body: &T) -> Response<Body> {
         .unwrap()
 }
 
-fn ephemeral_response(content: &str) -> Response<Body> {
-    json_response(
-        200,
-        &crate::dal::model::interaction_response::InteractionResponse::ephemeral(content),
-    )
+fn static_json_response(status: u16, body: &'static str) -> Response<Body> {
+    Response::builder()
+        .status(status)
+        .header("content-type", "application/json")
+        .body(body.into())
+        .unwrap()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+
+    #[test]
+    fn interaction_bodies_match_serialized_responses() {
+        let cases = [
+            (PONG_BODY, InteractionResponse::pong()),
+            (
+                GUILD_ID_MISSING_BODY,
+                InteractionResponse::ephemeral("Guild ID missing."),
+            ),
+        ];
+
+        for (body, response) in cases {
+            assert_eq!(body, serde_json::to_string(&response).unwrap());
+        }
+    }
+
+    #[test]
+    fn error_bodies_match_serialized_errors() {
+        let cases = [
+            (SERVER_ERROR_BODY, "Server misconfiguration"),
+            (INVALID_SIGNATURE_BODY, "Invalid request signature"),
+            (INVALID_JSON_BODY, "Invalid JSON"),
+        ];
+
+        for (body, message) in cases {
+            assert_eq!(body, json!({ "error": message }).to_string());
+        }
+    }
 }
@@ -1,34 +1,68 @@
+use aws_config::{retry::RetryConfig, timeout::TimeoutConfig};
 use lambda_http::{run, service_fn, Error};
+use std::time::Duration;
+use tracing::warn;
 use tracing_subscriber::{layer::SubscriberExt, util::SubscriberInitExt, EnvFilter};
 
 pub mod bal;
 pub mod dal;
 pub mod http_handler;
 
+const INIT_BUDGET: Duration = Duration::from_millis(500);
+
 #[tokio::main]
 async fn main() -> Result<(), Error> {
     tracing_subscriber::registry()
         .with(tracing_subscriber::fmt::layer())
-        .with(EnvFilter::try_from_default_env().unwrap_or_else(|_| EnvFilter::new("info")))
+        .with(EnvFilter::try_from_default_env().unwrap_or_else(|_| EnvFilter::new("warn")))
         .init();
 
-    let shared_config = aws_config::load_from_env().await;
+    let shared_config = aws_config::from_env()
+        .retry_config(RetryConfig::standard().with_max_attempts(2))
+        .timeout_config(
+            TimeoutConfig::builder()
+                .connect_timeout(Duration::from_secs(1))
+                .operation_attempt_timeout(Duration::from_secs(3))
+                .build(),
+        )
+        .load()
+        .await;
     let dynamo_client = aws_sdk_dynamodb::Client::new(&shared_config);
     let secrets_client = aws_sdk_secretsmanager::Client::new(&shared_config);
 
     let http_client = reqwest::Client::builder()
         .user_agent("cybersage-bot")
-        .pool_idle_timeout(std::time::Duration::from_secs(90))
-        .pool_max_idle_per_host(5)
+        .pool_idle_timeout(Duration::from_secs(90))
+        .pool_max_idle_per_host(10)
+        .tcp_keepalive(Duration::from_secs(60))
+        .connect_timeout(Duration::from_secs(1))
+        .read_timeout(Duration::from_secs(5))
+        .timeout(Duration::from_secs(10))
         .build()?;
 
-    run(service_fn(move |event| {
-        http_handler::function_handler(
-            event,
-            dynamo_client.clone(),
-            secrets_client.clone(),
-            http_client.clone(),
+    let init = tokio::time::timeout(INIT_BUDGET, async {
+        tokio::join!(
+            http_handler::init_verifying_key(secrets_client.clone(), http_client.clone()),
+            http_handler::init_bot_token(secrets_client.clone()),
         )
+    })
+    .await;
+
+    match init {
+        Ok((verifying_key, bot_token)) => {
+            if let Err(e) = verifying_key {
+                warn!(error = ?e, "Failed to resolve Discord public key during init");
+            }
+
+            if let Err(e) = bot_token {
+                warn!(error = ?e, "Failed to resolve Discord bot token during init");
+            }
+        }
+        Err(_) => warn!(budget = ?INIT_BUDGET, "Init secret fetch timed out"),
+    }
+
+    run(service_fn(move |event| {
+        http_handler::function_handler(event, dynamo_client.clone(), http_client.clone())
     }))
     .await
 }